@@ -1,8 +1,9 @@
 """Defines the class for managing a batch definition"""
 from __future__ import unicode_literals
 
-from jsonschema import validate
-from jsonschema.exceptions import ValidationError
+import copy
+
+from jsonschema import Draft4Validator
 
 import util.parse as parse
 from batch.configuration.definition.exceptions import InvalidDefinition
@@ -66,6 +67,9 @@ BATCH_DEFINITION_SCHEMA = {
     },
 }
 
+# The schema is static, so build its validator once rather than on every definition
+BATCH_DEFINITION_VALIDATOR = Draft4Validator(BATCH_DEFINITION_SCHEMA)
+
 
 class BatchDefinition(object):
     """Represents the definition for a batch."""
@@ -82,14 +86,64 @@ class BatchDefinition(object):
 
         self._definition = definition
 
+        errors = self._validate()
+        if errors:
+            raise InvalidDefinition('; '.join(errors))
+
+    @classmethod
+    def validate(cls, definition):
+        """Validates the given batch definition and returns any problems instead of raising an exception. This is
+        intended for checking many definitions at once. The given dictionary is not modified.
+
+        :param definition: The batch definition
+        :type definition: dict
+        :returns: A list of error messages, which is empty if the definition is valid
+        :rtype: [string]
+        """
+
+        batch_definition = cls.__new__(cls)
+        batch_definition._definition = copy.deepcopy(definition)
+        return batch_definition._validate()
+
+    def get_dict(self):
+        """Returns the internal dictionary that represents this batch definition
+
+        :returns: The internal dictionary
+        :rtype: dict
+        """
+
+        return self._definition
+
+    def _parse_date(self, value):
+        """Parses the given date range value into a datetime
+
+        :param value: The ISO 8601 date/time string
+        :type value: string
+        :returns: The parsed date/time or None if the value is not a valid ISO 8601 date/time with a timezone
+        :rtype: :class:`datetime.datetime`
+        """
+
+        # The parser returns None for strings that are not ISO 8601, and raises for ones missing a timezone
         try:
-            validate(definition, BATCH_DEFINITION_SCHEMA)
-        except ValidationError as ex:
-            raise InvalidDefinition('Invalid batch definition: %s' % unicode(ex))
+            return parse.parse_datetime(value)
+        except ValueError:
+            return None
+
+    def _validate(self):
+        """Validates the definition, populates its default values, and sets the attributes of this batch definition
+
+        :returns: A list of error messages, which is empty if the definition is valid
+        :rtype: [string]
+        """
+
+        errors = ['Invalid batch definition: %s' % unicode(ex)
+                  for ex in BATCH_DEFINITION_VALIDATOR.iter_errors(self._definition)]
+        if errors:
+            return errors
 
         self._populate_default_values()
         if not self._definition['version'] == '1.0':
-            raise InvalidDefinition('%s is an unsupported version number' % self._definition['version'])
+            return ['%s is an unsupported version number' % self._definition['version']]
 
         date_range = self._definition['date_range'] if 'date_range' in self._definition else None
         self.date_range_type = None
@@ -98,35 +152,24 @@ class BatchDefinition(object):
 
         self.started = None
         if date_range and 'started' in date_range:
-            try:
-                self.started = parse.parse_datetime(date_range['started'])
-            except ValueError:
-                raise InvalidDefinition('Invalid start date format: %s' % date_range['started'])
+            self.started = self._parse_date(date_range['started'])
+            if not self.started:
+                errors.append('Invalid start date format: %s' % date_range['started'])
         self.ended = None
         if date_range and 'ended' in date_range:
-            try:
-                self.ended = parse.parse_datetime(date_range['ended'])
-            except ValueError:
-                raise InvalidDefinition('Invalid end date format: %s' % date_range['ended'])
+            self.ended = self._parse_date(date_range['ended'])
+            if not self.ended:
+                errors.append('Invalid end date format: %s' % date_range['ended'])
 
         self.job_names = self._definition['job_names']
         self.all_jobs = self._definition['all_jobs']
 
+        # The schema already guarantees the priority is an integer
         self.priority = None
         if 'priority' in self._definition:
-            try:
-                self.priority = self._definition['priority']
-            except ValueError:
-                raise InvalidDefinition('Invalid priority: %s' % self._definition['priority'])
+            self.priority = self._definition['priority']
 
-    def get_dict(self):
-        """Returns the internal dictionary that represents this batch definition
-
-        :returns: The internal dictionary
-        :rtype: dict
-        """
-
-        return self._definition
+        return errors
 
     def _populate_default_values(self):
         """Goes through the definition and populates any missing values with defaults"""
@@ -93,6 +93,18 @@ class TestBatchDefinition(TestCase):
 
         self.assertRaises(InvalidDefinition, BatchDefinition, definition)
 
+    def test_date_range_ended_invalid(self):
+        """Tests defining a date range with an end date that has a timezone but an invalid format"""
+
+        definition = {
+            'version': '1.0',
+            'date_range': {
+                'ended': '2016-12-31Z',
+            },
+        }
+
+        self.assertRaises(InvalidDefinition, BatchDefinition, definition)
+
     def test_job_names(self):
         """Tests defining a list of job names"""
 
@@ -138,3 +150,19 @@ class TestBatchDefinition(TestCase):
         }
 
         self.assertRaises(InvalidDefinition, BatchDefinition, definition)
+
+    def test_validate(self):
+        """Tests validating definitions without raising an exception"""
+
+        definition = {
+            'version': '1.0',
+            'date_range': {
+                'started': 'BAD',
+                'ended': '2016-12-31T00:00:00.000Z',
+            },
+        }
+
+        self.assertListEqual(BatchDefinition.validate({'version': '1.0'}), [])
+        self.assertEqual(len(BatchDefinition.validate(definition)), 1)
+        self.assertEqual(len(BatchDefinition.validate({'version': '1.0', 'priority': 'BAD'})), 1)
+        self.assertNotIn('type', definition['date_range'])
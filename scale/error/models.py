@@ -22,10 +22,11 @@ class ErrorManager(models.Manager):
         :rtype: :class:`error.models.Error`
         """
 
-        if name not in CACHED_BUILTIN_ERRORS:
+        error = CACHED_BUILTIN_ERRORS.get(name)
+        if error is None:
             error = Error.objects.get(name=name)
             CACHED_BUILTIN_ERRORS[name] = error
-        return CACHED_BUILTIN_ERRORS[name]
+        return error
 
     def get_database_error(self):
         """Returns the error for a database problem
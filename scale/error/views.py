@@ -14,6 +14,10 @@ from util.rest import BadParameter
 
 logger = logging.getLogger(__name__)
 
+_parse_category = rest_util.make_string_parser('category', accepted_values=[c for c, _ in Error.CATEGORIES])
+_parse_optional_category = rest_util.make_string_parser('category', required=False,
+                                                        accepted_values=[c for c, _ in Error.CATEGORIES])
+
 
 class ErrorsView(GenericAPIView):
     """This view is the endpoint for retrieving the list of all errors and creating a new error."""
@@ -53,7 +57,7 @@ class ErrorsView(GenericAPIView):
         name = rest_util.parse_string(request, 'name')
         title = rest_util.parse_string(request, 'title')
         description = rest_util.parse_string(request, 'description')
-        category = rest_util.parse_string(request, 'category', accepted_values=[c for c, _ in Error.CATEGORIES])
+        category = _parse_category(request)
 
         # Do not allow the creation of SYSTEM level errors
         if category == 'SYSTEM':
@@ -110,8 +114,7 @@ class ErrorDetailsView(GenericAPIView):
 
         title = rest_util.parse_string(request, 'title', required=False)
         description = rest_util.parse_string(request, 'description', required=False)
-        category = rest_util.parse_string(request, 'category', required=False,
-                                          accepted_values=[c for c, _ in Error.CATEGORIES])
+        category = _parse_optional_category(request)
 
         # Do not allow editing of SYSTEM level errors
         if category == 'SYSTEM':
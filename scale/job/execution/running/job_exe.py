@@ -3,9 +3,10 @@ from __future__ import unicode_literals
 
 import logging
 import threading
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 from django.db import transaction
+from django.db.models import Count
 from django.utils.timezone import now
 
 from error.models import Error
@@ -19,6 +20,38 @@ from util.retry import retry_database_query
 
 logger = logging.getLogger(__name__)
 
+# Objects that cannot be imported at module load due to circular imports, set on first use
+QUEUE_MODEL = None
+SCHEDULER_MGR = None
+
+
+def _get_queue_model():
+    """Returns the Queue model class, importing it on the first call
+
+    :returns: The Queue model class
+    :rtype: type
+    """
+
+    global QUEUE_MODEL
+    if QUEUE_MODEL is None:
+        from queue.models import Queue
+        QUEUE_MODEL = Queue
+    return QUEUE_MODEL
+
+
+def _get_scheduler_mgr():
+    """Returns the scheduler manager, importing it on the first call
+
+    :returns: The scheduler manager
+    :rtype: :class:`scheduler.sync.scheduler_manager.SchedulerManager`
+    """
+
+    global SCHEDULER_MGR
+    if SCHEDULER_MGR is None:
+        from scheduler.sync.scheduler_manager import scheduler_mgr
+        SCHEDULER_MGR = scheduler_mgr
+    return SCHEDULER_MGR
+
 
 class RunningJobExecution(object):
     """This class represents a currently running job execution. This class is thread-safe."""
@@ -39,19 +72,22 @@ class RunningJobExecution(object):
         else:
             self._docker_volumes = []
 
-        self._lock = threading.Lock()  # Protects _current_task and _remaining_tasks
+        # Protects changes to _current_task and _next_task_index. A single read of either attribute is safe without the
+        # lock (attribute assignment is atomic under the GIL), but checks that need both attributes to agree must still
+        # hold the lock.
+        self._lock = threading.Lock()
         self._current_task = None
-        self._remaining_tasks = []
-        self._all_tasks = []
+        self._next_task_index = 0  # Index in _all_tasks of the next task to start, tasks from here on remain
+        self._container_names = None  # Cached once finished, container names cannot change after that
 
         # Create tasks
+        tasks = []
         if not job_exe.is_system:
-            self._all_tasks.append(PreTask(job_exe))
-        self._all_tasks.append(JobTask(job_exe))
+            tasks.append(PreTask(job_exe))
+        tasks.append(JobTask(job_exe))
         if not job_exe.is_system:
-            self._all_tasks.append(PostTask(job_exe))
-        for task in self._all_tasks:
-            self._remaining_tasks.append(task)
+            tasks.append(PostTask(job_exe))
+        self._all_tasks = tuple(tasks)
 
     @property
     def current_task(self):
@@ -111,18 +147,15 @@ class RunningJobExecution(object):
         :rtype: :class:`job.execution.running.tasks.base_task.Task`
         """
 
-        # Saves this job execution's task info to the database
-        with transaction.atomic():
-            job_exe = JobExecution.objects.get_locked_job_exe(self._id)
-            for task in self._all_tasks:
-                task.populate_job_exe_model(job_exe)
-            job_exe.save()
+        # Saves this job execution's task info to the database, there is nothing to save if no task has started or ended
+        if any(task.has_started or task.has_ended for task in self._all_tasks):
+            with transaction.atomic():
+                job_exe = JobExecution.objects.get_locked_job_exe(self._id)
+                for task in self._all_tasks:
+                    task.populate_job_exe_model(job_exe)
+                job_exe.save()
 
-        with self._lock:
-            task = self._current_task
-            self._current_task = None
-            self._remaining_tasks = []
-            return task
+        return self._clear_tasks()
 
     @retry_database_query
     def execution_lost(self, when):
@@ -135,14 +168,10 @@ class RunningJobExecution(object):
         """
 
         error = Error.objects.get_builtin_error('node-lost')
-        from queue.models import Queue
+        Queue = _get_queue_model()
         Queue.objects.handle_job_failure(self._id, when, self._all_tasks, error)
 
-        with self._lock:
-            task = self._current_task
-            self._current_task = None
-            self._remaining_tasks = []
-            return task
+        return self._clear_tasks()
 
     @retry_database_query
     def execution_timed_out(self, when):
@@ -155,14 +184,10 @@ class RunningJobExecution(object):
         """
 
         error = Error.objects.get_builtin_error('timeout')
-        from queue.models import Queue
+        Queue = _get_queue_model()
         Queue.objects.handle_job_failure(self._id, when, self._all_tasks, error)
 
-        with self._lock:
-            task = self._current_task
-            self._current_task = None
-            self._remaining_tasks = []
-            return task
+        return self._clear_tasks()
 
     def get_container_names(self):
         """Returns the list of container names for all tasks in this job execution
@@ -171,12 +196,14 @@ class RunningJobExecution(object):
         :rtype: [string]
         """
 
-        containers = []
-        with self._lock:
-            for task in self._all_tasks:
-                if task.container_name:
-                    containers.append(task.container_name)
-            return containers
+        if self._container_names is not None:
+            return self._container_names
+
+        # The task tuple never changes, so it can be read without the lock
+        containers = [task.container_name for task in self._all_tasks if task.container_name]
+        if self.is_finished():
+            self._container_names = containers
+        return containers
 
     def is_finished(self):
         """Indicates whether this job execution is finished with all tasks
@@ -185,8 +212,12 @@ class RunningJobExecution(object):
         :rtype: bool
         """
 
+        # A running task means this job execution is not finished, so the common case does not need the lock
+        if self._current_task:
+            return False
+
         with self._lock:
-            return not self._current_task and not self._remaining_tasks
+            return not self._current_task and self._next_task_index >= len(self._all_tasks)
 
     def is_next_task_ready(self):
         """Indicates whether the next task in this job execution is ready
@@ -195,8 +226,12 @@ class RunningJobExecution(object):
         :rtype: bool
         """
 
+        # A running task means the next task is not ready, so the common case does not need the lock
+        if self._current_task:
+            return False
+
         with self._lock:
-            return not self._current_task and self._remaining_tasks
+            return not self._current_task and self._next_task_index < len(self._all_tasks)
 
     def next_task_resources(self):
         """Returns the resources that are required by the next task in this job execution. Returns None if there are no
@@ -206,12 +241,12 @@ class RunningJobExecution(object):
         :rtype: :class:`job.resources.NodeResources`
         """
 
-        with self._lock:
-            if not self._remaining_tasks:
-                return None
+        next_task_index = self._next_task_index
+        if next_task_index >= len(self._all_tasks):
+            return None
 
-            next_task = self._remaining_tasks[0]
-            return next_task.get_resources()
+        next_task = self._all_tasks[next_task_index]
+        return next_task.get_resources()
 
     def start_next_task(self):
         """Starts the next task in the job execution and returns it. Returns None if the next task is not ready or no
@@ -222,10 +257,11 @@ class RunningJobExecution(object):
         """
 
         with self._lock:
-            if self._current_task or not self._remaining_tasks:
+            if self._current_task or self._next_task_index >= len(self._all_tasks):
                 return None
 
-            self._current_task = self._remaining_tasks.pop(0)
+            self._current_task = self._all_tasks[self._next_task_index]
+            self._next_task_index += 1
             return self._current_task
 
     def task_update(self, task_update):
@@ -235,14 +271,23 @@ class RunningJobExecution(object):
         :type task_update: :class:`job.execution.running.tasks.update.TaskStatusUpdate`
         """
 
-        if task_update.status == TaskStatusUpdate.RUNNING:
-            self._task_start(task_update)
-        elif task_update.status == TaskStatusUpdate.FINISHED:
-            self._task_complete(task_update)
-        elif task_update.status == TaskStatusUpdate.LOST:
-            self._task_lost(task_update)
-        elif task_update.status in [TaskStatusUpdate.FAILED, TaskStatusUpdate.KILLED]:
-            self._task_fail(task_update)
+        handler_name = self._TASK_UPDATE_HANDLERS.get(task_update.status)
+        if handler_name:
+            getattr(self, handler_name)(task_update)
+
+    def _clear_tasks(self):
+        """Clears the current task and all remaining tasks so that this job execution is finished, returning the task
+        that was current
+
+        :returns: The task that was current, possibly None
+        :rtype: :class:`job.execution.running.tasks.base_task.Task`
+        """
+
+        with self._lock:
+            task = self._current_task
+            self._current_task = None
+            self._next_task_index = len(self._all_tasks)
+            return task
 
     @retry_database_query
     def _task_complete(self, task_update):
@@ -254,7 +299,7 @@ class RunningJobExecution(object):
 
         with self._lock:
             current_task = self._current_task
-            remaining_tasks = self._remaining_tasks
+            remaining_tasks = self._all_tasks[self._next_task_index:]
 
         if not current_task or current_task.id != task_update.task_id:
             return
@@ -266,7 +311,7 @@ class RunningJobExecution(object):
                 for task in remaining_tasks:
                     task.refresh_cached_values(job_exe)
             if not remaining_tasks:
-                from queue.models import Queue
+                Queue = _get_queue_model()
                 Queue.objects.handle_job_completion(self._id, now(), self._all_tasks)
 
         with self._lock:
@@ -285,40 +330,38 @@ class RunningJobExecution(object):
         if not current_task or current_task.id != task_update.task_id:
             return
 
+        when = now()
         with transaction.atomic():
             current_task.update(task_update)
             error = current_task.determine_error(task_update)
-            from queue.models import Queue
-            Queue.objects.handle_job_failure(self._id, now(), self._all_tasks, error)
+            Queue = _get_queue_model()
+            Queue.objects.handle_job_failure(self._id, when, self._all_tasks, error)
 
             # TODO: move this somewhere else and refactor it
-            from scheduler.models import Scheduler
-            job_exe = JobExecution.objects.get_job_exe_with_job_and_job_type(self._id)
-            node = job_exe.node
             if not error:
                 error = Error.objects.get_unknown_error()
             # Check for a high number of system errors and decide if we should pause the node
-            if error.category == 'SYSTEM' and job_exe.job.num_exes >= job_exe.job.max_tries and node is not None and not node.is_paused:
-                # search Job.objects. for the number of system failures in the past (configurable) 1 minute
-                # if (configurable) 5 or more have occurred, pause the node
-                node_error_period = Scheduler.objects.first().node_error_period
-                if node_error_period > 0:
-                    check_time = datetime.utcnow() - timedelta(minutes=node_error_period)
-                    # find out how many jobs have recently failed on this node with a system error
-                    num_node_errors = JobExecution.objects.select_related('error', 'node').filter(
-                        status='FAILED', error__category='SYSTEM', ended__gte=check_time, node=node).distinct('job').count()
-                    max_node_errors = Scheduler.objects.first().max_node_errors
-                    if num_node_errors >= max_node_errors:
-                        logger.warning('%s failed %d jobs in %d minutes, pausing the host' % (node.hostname, num_node_errors, node_error_period))
-                        with transaction.atomic():
+            if error.category == 'SYSTEM':
+                job_exe = JobExecution.objects.select_related('job', 'node').defer('stdout', 'stderr').get(pk=self._id)
+                node = job_exe.node
+                if job_exe.job.num_exes >= job_exe.job.max_tries and node is not None and not node.is_paused:
+                    # search Job.objects. for the number of system failures in the past (configurable) 1 minute
+                    # if (configurable) 5 or more have occurred, pause the node
+                    node_error_period, max_node_errors = _get_scheduler_mgr().get_node_error_settings()
+                    if node_error_period > 0:
+                        check_time = when - timedelta(minutes=node_error_period)
+                        # find out how many jobs have recently failed on this node with a system error
+                        num_node_errors = JobExecution.objects.filter(
+                            status='FAILED', error__category='SYSTEM', ended__gte=check_time, node=node
+                        ).aggregate(num_jobs=Count('job', distinct=True))['num_jobs']
+                        if num_node_errors >= max_node_errors:
+                            logger.warning('%s failed %d jobs in %d minutes, pausing the host' % (node.hostname, num_node_errors, node_error_period))
                             node.is_paused = True
                             node.is_paused_errors = True
                             node.pause_reason = "System Failure Rate Too High"
-                            node.save()
+                            node.save(update_fields=['is_paused', 'is_paused_errors', 'pause_reason', 'last_modified'])
 
-        with self._lock:
-            self._current_task = None
-            self._remaining_tasks = []
+        self._clear_tasks()
 
     def _task_lost(self, task_update):
         """Tells this job execution that one of its tasks was lost
@@ -332,7 +375,7 @@ class RunningJobExecution(object):
                 return
 
             self._current_task.update(task_update)
-            self._remaining_tasks.insert(0, self._current_task)
+            self._next_task_index -= 1  # The current task is always the one just before the next task
             self._current_task = None
 
     @retry_database_query
@@ -348,3 +391,13 @@ class RunningJobExecution(object):
             return
 
         current_task.update(task_update)
+
+    # Maps each task status to the name of the method that handles it, other statuses are ignored. Names are looked up
+    # on the instance so that overridden and patched methods are used.
+    _TASK_UPDATE_HANDLERS = {
+        TaskStatusUpdate.RUNNING: '_task_start',
+        TaskStatusUpdate.FINISHED: '_task_complete',
+        TaskStatusUpdate.LOST: '_task_lost',
+        TaskStatusUpdate.FAILED: '_task_fail',
+        TaskStatusUpdate.KILLED: '_task_fail',
+    }
@@ -1,7 +1,8 @@
 """Defines the class for a cleanup task"""
 from __future__ import unicode_literals
 
-import threading
+import itertools
+import pipes
 
 from job.execution.running.tasks.base_task import Task
 from job.resources import NodeResources
@@ -10,30 +11,8 @@ from job.resources import NodeResources
 CLEANUP_TASK_ID_PREFIX = 'scale_cleanup'
 
 
-class AtomicCounter(object):
-    """Represents an atomic counter
-    """
-
-    def __init__(self):
-        """Constructor
-        """
-
-        self._counter = 0
-        self._lock = threading.Lock()
-
-    def get_next(self):
-        """Returns the next integer
-
-        :returns: The next integer
-        :rtype: int
-        """
-
-        with self._lock:
-            self._counter += 1
-            return self._counter
-
-
-COUNTER = AtomicCounter()
+# Generates unique task ID numbers, next() on itertools.count is atomic in CPython so no lock is needed
+COUNTER = itertools.count(1)
 
 
 class CleanupTask(Task):
@@ -51,7 +30,7 @@ class CleanupTask(Task):
         :type job_exes: [:class:`job.execution.running.job_exe.RunningJobExecution`]
         """
 
-        task_id = '%s_%s_%d' % (CLEANUP_TASK_ID_PREFIX, framework_id, COUNTER.get_next())
+        task_id = '%s_%s_%d' % (CLEANUP_TASK_ID_PREFIX, framework_id, next(COUNTER))
         super(CleanupTask, self).__init__(task_id, 'Scale Cleanup', agent_id)
 
         self._job_exes = job_exes
@@ -63,37 +42,36 @@ class CleanupTask(Task):
         self._is_docker_privileged = False
 
         # Define basic command pieces
-        for_cmd = 'for %s in `%s`; do %s; done'
         nonrunning_filters = '-f status=created -f status=dead -f status=exited'
         all_nonrunning_containers_cmd = 'docker ps %s --format \'{{.Names}}\'' % nonrunning_filters
         all_dangling_volumes_cmd = 'docker volume ls -f dangling=true -q'
-        container_delete_cmd = 'docker rm $cont'
-        volume_delete_cmd = 'docker volume rm $vol'
 
-        # Create commands that list the containers/volumes to delete
+        # Create commands that delete the containers/volumes, each with a single Docker invocation
+        commands = []
         if self._is_initial_cleanup:
             # Initial clean up deletes all non-running containers
-            container_list_cmd = all_nonrunning_containers_cmd
+            commands.append('%s | xargs -r docker rm' % all_nonrunning_containers_cmd)
 
             # TODO: once we upgrade to a later version of Docker (1.12+), we can delete volumes based on their name
             # starting with "scale_" (and also dangling)
             # Initial clean up deletes all dangling Docker volumes
-            volume_list_cmd = all_dangling_volumes_cmd
+            commands.append('%s | xargs -r docker volume rm' % all_dangling_volumes_cmd)
         else:
-            # Deletes all containers and volumes for the given job executions
-            containers = []
-            volumes = []
+            # Deletes all containers and volumes for the given job executions. Some of them may never have been
+            # created or may have already been removed, which should not fail the clean up.
+            # Names are de-duplicated and sorted so the command is as short as possible and deterministic.
+            containers = set()
+            volumes = set()
             for job_exe in self._job_exes:
-                containers.extend(job_exe.get_container_names())
-                volumes.extend(job_exe.docker_volumes)
-            container_list_cmd = '%s | grep -e %s' % (all_nonrunning_containers_cmd, ' -e '.join(containers))
-            volume_list_cmd = '%s | grep -e %s' % (all_dangling_volumes_cmd, ' -e '.join(volumes))
-
-        delete_containers_cmd = for_cmd % ('cont', container_list_cmd, container_delete_cmd)
-        delete_volumes_cmd = for_cmd % ('vol', volume_list_cmd, volume_delete_cmd)
+                containers.update(job_exe.get_container_names())
+                volumes.update(job_exe.docker_volumes)
+            if containers:
+                commands.append('docker rm %s || true' % ' '.join(pipes.quote(name) for name in sorted(containers)))
+            if volumes:
+                commands.append('docker volume rm %s || true' % ' '.join(pipes.quote(name) for name in sorted(volumes)))
 
         # Create overall command that deletes containers and volumes for the job executions
-        self._command = '%s; %s' % (delete_containers_cmd, delete_volumes_cmd)
+        self._command = '; '.join(commands) if commands else 'true'
 
     @property
     def is_initial_cleanup(self):
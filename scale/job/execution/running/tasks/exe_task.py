@@ -11,6 +11,9 @@ from job.execution.running.tasks.base_task import Task
 
 JOB_TASK_ID_PREFIX = 'scale_job'
 
+# The Scale Docker image name is built from settings that do not change while the scheduler runs, so it is cached
+SCALE_IMAGE_NAME = None
+
 
 class JobExecutionTask(Task):
     """Abstract base class for a job execution task. A job execution consists of three tasks: the pre-task,
@@ -29,9 +32,11 @@ class JobExecutionTask(Task):
         :type job_exe: :class:`job.models.JobExecution`
         """
 
-        task_name = '%s %s' % (job_exe.job.job_type.title, job_exe.job.job_type.version)
-        if not job_exe.is_system:
-            task_name = 'Scale %s' % task_name
+        job_type = job_exe.job.job_type
+        if job_exe.is_system:
+            task_name = '%s %s' % (job_type.title, job_type.version)
+        else:
+            task_name = 'Scale %s %s' % (job_type.title, job_type.version)
         super(JobExecutionTask, self).__init__(task_id, task_name, job_exe.node.slave_id)
 
         # Keep job execution values that should not change
@@ -66,7 +71,11 @@ class JobExecutionTask(Task):
             if self._task_id != task_update.task_id:
                 return
 
-            # Support duplicate calls to complete(), task updates may repeat
+            # Support duplicate calls to complete(), task updates may repeat or arrive out of order. An update that is
+            # no newer than the one that already completed this task changes nothing.
+            if self._has_ended and task_update.timestamp <= self._ended:
+                return False
+
             self._has_ended = True
             self._ended = task_update.timestamp
             self._exit_code = task_update.exit_code
@@ -81,7 +90,10 @@ class JobExecutionTask(Task):
         :rtype: string
         """
 
-        return '%s:%s' % (settings.SCALE_DOCKER_IMAGE, settings.DOCKER_VERSION)
+        global SCALE_IMAGE_NAME
+        if SCALE_IMAGE_NAME is None:
+            SCALE_IMAGE_NAME = '%s:%s' % (settings.SCALE_DOCKER_IMAGE, settings.DOCKER_VERSION)
+        return SCALE_IMAGE_NAME
 
     @abstractmethod
     def determine_error(self, task_update):
@@ -34,7 +34,11 @@ class PreTask(JobExecutionTask):
             if self._task_id != task_update.task_id:
                 return
 
-            # Support duplicate calls to complete(), task updates may repeat
+            # Support duplicate calls to complete(), task updates may repeat or arrive out of order. An update that is
+            # no newer than the one that already completed this task changes nothing.
+            if self._has_ended and task_update.timestamp <= self._ended:
+                return False
+
             self._has_ended = True
             self._ended = task_update.timestamp
             self._exit_code = task_update.exit_code
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0022_jobtype_configuration'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='jobexecution',
+            index_together=set([('node', 'status', 'ended')]),
+        ),
+    ]
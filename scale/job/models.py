@@ -766,6 +766,27 @@ class Job(models.Model):
         index_together = ['last_modified', 'job_type', 'status']
 
 
+def is_job_exe_timed_out(status, started, timeout, when):
+    """Indicates whether a job execution with the given field values is timed out based on the given current time. This
+    allows the check to be made on values queried from the database without creating a job execution model.
+
+    :param status: The status of the job execution
+    :type status: string
+    :param started: When the job execution started
+    :type started: :class:`datetime.datetime`
+    :param timeout: The timeout of the job execution in seconds
+    :type timeout: int
+    :param when: The current time
+    :type when: :class:`datetime.datetime`
+    :returns: True if the job execution is timed out, False otherwise
+    :rtype: bool
+    """
+
+    if status != 'RUNNING' or not timeout:
+        return False
+    return started + datetime.timedelta(seconds=timeout) < when
+
+
 class JobExecutionManager(models.Manager):
     """Provides additional methods for handling job executions."""
 
@@ -1569,13 +1590,11 @@ class JobExecution(models.Model):
 
         :param when: The current time
         :type when: :class:`datetime.datetime`
-        :returns: True if this job execution is for a system job, False otherwise
+        :returns: True if this job execution is timed out, False otherwise
         :rtype: bool
         """
 
-        running_with_timeout_set = self.status == 'RUNNING' and self.timeout
-        timeout_exceeded = self.started + datetime.timedelta(seconds=self.timeout) < when
-        return running_with_timeout_set and timeout_exceeded
+        return is_job_exe_timed_out(self.status, self.started, self.timeout, when)
 
     def set_cluster_id(self, framework_id):
         """Sets the unique cluster ID for this job execution
@@ -1599,6 +1618,7 @@ class JobExecution(models.Model):
     class Meta(object):
         """Meta information for the database"""
         db_table = 'job_exe'
+        index_together = ['node', 'status', 'ended']
 
 
 class JobTypeStatusCounts(object):
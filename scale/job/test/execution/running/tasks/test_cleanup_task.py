@@ -0,0 +1,65 @@
+from __future__ import unicode_literals
+
+import django
+from django.test import TestCase
+from mock import MagicMock
+
+from job.execution.running.tasks.cleanup_task import CleanupTask
+
+
+class TestCleanupTask(TestCase):
+    """Tests the CleanupTask class"""
+
+    def setUp(self):
+        django.setup()
+
+    def test_initial_cleanup_command(self):
+        """Tests the command for an initial clean up, which deletes all non-running containers and dangling volumes"""
+
+        task = CleanupTask('framework_1', 'agent_1', [])
+
+        self.assertTrue(task.is_initial_cleanup)
+        expected_command = ("docker ps -f status=created -f status=dead -f status=exited --format '{{.Names}}' | "
+                            "xargs -r docker rm; docker volume ls -f dangling=true -q | xargs -r docker volume rm")
+        self.assertEqual(task.command, expected_command)
+
+    def test_shared_volumes_command(self):
+        """Tests the command for job executions that share volume names, which should each be deleted only once"""
+
+        job_exe_1 = MagicMock()
+        job_exe_1.get_container_names.return_value = ['scale_1_job', 'scale_1_pre']
+        job_exe_1.docker_volumes = ['scale_shared', 'scale_1_vol']
+        job_exe_2 = MagicMock()
+        job_exe_2.get_container_names.return_value = ['scale_2_pre']
+        job_exe_2.docker_volumes = ['scale_shared']
+
+        task = CleanupTask('framework_1', 'agent_1', [job_exe_1, job_exe_2])
+
+        self.assertFalse(task.is_initial_cleanup)
+        expected_command = ('docker rm scale_1_job scale_1_pre scale_2_pre || true; '
+                            'docker volume rm scale_1_vol scale_shared || true')
+        self.assertEqual(task.command, expected_command)
+
+    def test_quoted_names_command(self):
+        """Tests that container and volume names are quoted for the shell"""
+
+        job_exe = MagicMock()
+        job_exe.get_container_names.return_value = ['scale 1']
+        job_exe.docker_volumes = ["scale'1"]
+
+        task = CleanupTask('framework_1', 'agent_1', [job_exe])
+
+        expected_command = "docker rm 'scale 1' || true; docker volume rm 'scale'\"'\"'1' || true"
+        self.assertEqual(task.command, expected_command)
+
+    def test_nothing_to_delete_command(self):
+        """Tests the command for a job execution with no containers or volumes"""
+
+        job_exe = MagicMock()
+        job_exe.get_container_names.return_value = []
+        job_exe.docker_volumes = []
+
+        task = CleanupTask('framework_1', 'agent_1', [job_exe])
+
+        self.assertFalse(task.is_initial_cleanup)
+        self.assertEqual(task.command, 'true')
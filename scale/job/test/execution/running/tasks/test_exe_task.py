@@ -0,0 +1,108 @@
+from __future__ import unicode_literals
+
+from datetime import timedelta
+
+import django
+from django.test import TestCase
+from django.utils.timezone import now
+
+import job.test.utils as job_test_utils
+from job.execution.running.tasks.job_task import JobTask
+from job.execution.running.tasks.pre_task import PreTask
+from job.execution.running.tasks.update import TaskStatusUpdate
+from job.models import JobExecution
+from scheduler.models import Scheduler
+
+
+class TestJobExecutionTask(TestCase):
+    """Tests completing job execution tasks with repeated and out of order task updates"""
+
+    def setUp(self):
+        django.setup()
+
+        Scheduler.objects.initialize_scheduler()
+        job_exe = job_test_utils.create_job_exe(status='RUNNING')
+        self._job_exe = JobExecution.objects.get_job_exe_with_job_and_job_type(job_exe.id)
+        self._finished = now()
+
+    def test_job_task_repeated_update(self):
+        """Tests completing a job task with a repeated FINISHED update"""
+
+        task = JobTask(self._job_exe)
+        update = self._create_finished_update(task, self._finished, 0)
+        self.assertFalse(task.complete(update))
+
+        self.assertFalse(task.complete(update))
+        self._assert_job_task_ended(task, self._finished, 0)
+
+    def test_job_task_older_update(self):
+        """Tests completing a job task with a FINISHED update that is older than the one that completed it"""
+
+        task = JobTask(self._job_exe)
+        task.complete(self._create_finished_update(task, self._finished, 0))
+
+        older_update = self._create_finished_update(task, self._finished - timedelta(seconds=1), 1)
+        self.assertFalse(task.complete(older_update))
+        self._assert_job_task_ended(task, self._finished, 0)
+
+    def test_job_task_newer_update(self):
+        """Tests completing a job task with a FINISHED update that is newer than the one that completed it"""
+
+        task = JobTask(self._job_exe)
+        task.complete(self._create_finished_update(task, self._finished, 0))
+
+        newer_finished = self._finished + timedelta(seconds=1)
+        self.assertFalse(task.complete(self._create_finished_update(task, newer_finished, 1)))
+        self._assert_job_task_ended(task, newer_finished, 1)
+
+    def test_pre_task_repeated_update(self):
+        """Tests completing a pre-task with a repeated FINISHED update"""
+
+        task = PreTask(self._job_exe)
+        update = self._create_finished_update(task, self._finished, 0)
+        self.assertTrue(task.complete(update))
+
+        self.assertFalse(task.complete(update))
+        self._assert_pre_task_ended(task, self._finished, 0)
+
+    def test_pre_task_older_update(self):
+        """Tests completing a pre-task with a FINISHED update that is older than the one that completed it"""
+
+        task = PreTask(self._job_exe)
+        self.assertTrue(task.complete(self._create_finished_update(task, self._finished, 0)))
+
+        older_update = self._create_finished_update(task, self._finished - timedelta(seconds=1), 1)
+        self.assertFalse(task.complete(older_update))
+        self._assert_pre_task_ended(task, self._finished, 0)
+
+    def test_pre_task_newer_update(self):
+        """Tests completing a pre-task with a FINISHED update that is newer than the one that completed it"""
+
+        task = PreTask(self._job_exe)
+        self.assertTrue(task.complete(self._create_finished_update(task, self._finished, 0)))
+
+        newer_finished = self._finished + timedelta(seconds=1)
+        self.assertTrue(task.complete(self._create_finished_update(task, newer_finished, 1)))
+        self._assert_pre_task_ended(task, newer_finished, 1)
+
+    def _assert_job_task_ended(self, task, ended, exit_code):
+        """Asserts that the given job task has the given end time and exit code"""
+
+        job_exe = JobExecution()
+        task.populate_job_exe_model(job_exe)
+        self.assertEqual(job_exe.job_completed, ended)
+        self.assertEqual(job_exe.job_exit_code, exit_code)
+
+    def _assert_pre_task_ended(self, task, ended, exit_code):
+        """Asserts that the given pre-task has the given end time and exit code"""
+
+        job_exe = JobExecution()
+        task.populate_job_exe_model(job_exe)
+        self.assertEqual(job_exe.pre_completed, ended)
+        self.assertEqual(job_exe.pre_exit_code, exit_code)
+
+    def _create_finished_update(self, task, when, exit_code):
+        """Creates a FINISHED task update for the given task"""
+
+        return job_test_utils.create_task_status_update(task.id, 'agent', TaskStatusUpdate.FINISHED, when,
+                                                        exit_code=exit_code)
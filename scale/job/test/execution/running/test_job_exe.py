@@ -5,13 +5,17 @@ from datetime import timedelta
 import django
 from django.test import TestCase
 from django.utils.timezone import now
+from mock import patch
 
+import error.test.utils as error_test_utils
 import job.test.utils as job_test_utils
 from error.models import Error, CACHED_BUILTIN_ERRORS
 from job.execution.running.job_exe import RunningJobExecution
 from job.execution.running.tasks.update import TaskStatusUpdate
 from job.models import JobExecution
+from node.models import Node
 from scheduler.models import Scheduler
+from scheduler.sync.scheduler_manager import SchedulerManager
 
 
 class TestRunningJobExecution(TestCase):
@@ -271,6 +275,18 @@ class TestRunningJobExecution(TestCase):
         self.assertTrue(running_job_exe.is_finished())
         self.assertFalse(running_job_exe.is_next_task_ready())
 
+    def test_task_update_uses_patched_handler(self):
+        """Tests that task updates are dispatched to the handler method looked up on the instance"""
+
+        job_exe = JobExecution.objects.get_job_exe_with_job_and_job_type(self._job_exe_id)
+        running_job_exe = RunningJobExecution(job_exe)
+        task = running_job_exe.start_next_task()
+
+        update = job_test_utils.create_task_status_update(task.id, 'agent', TaskStatusUpdate.KILLED, now())
+        with patch.object(running_job_exe, '_task_fail') as mock_task_fail:
+            running_job_exe.task_update(update)
+        mock_task_fail.assert_called_once_with(update)
+
     def test_pre_task_launch_error(self):
         """Tests running through a job execution where a pre-task fails to launch"""
 
@@ -293,6 +309,26 @@ class TestRunningJobExecution(TestCase):
         self.assertEqual(job_exe.status, 'FAILED')
         self.assertEqual(job_exe.error.name, 'docker-task-launch')
 
+    def test_system_errors_pause_node(self):
+        """Tests that a node is paused when a task fails with a system error and the node has too many recent system
+        errors"""
+
+        node = self._fail_pre_task_with_node_errors(2)
+
+        self.assertTrue(node.is_paused)
+        self.assertTrue(node.is_paused_errors)
+        self.assertEqual(node.pause_reason, 'System Failure Rate Too High')
+
+    def test_system_errors_below_max_do_not_pause_node(self):
+        """Tests that a node is not paused when a task fails with a system error and the node has few recent system
+        errors"""
+
+        node = self._fail_pre_task_with_node_errors(1)
+
+        self.assertFalse(node.is_paused)
+        self.assertFalse(node.is_paused_errors)
+        self.assertIsNone(node.pause_reason)
+
     def test_job_task_launch_error(self):
         """Tests running through a job execution where a Docker-based job-task fails to launch"""
 
@@ -460,3 +496,39 @@ class TestRunningJobExecution(TestCase):
         job_exe = JobExecution.objects.select_related().get(id=self._job_exe_id)
         self.assertEqual(job_exe.status, 'FAILED')
         self.assertEqual(job_exe.error.name, 'docker-terminated')
+
+    def _fail_pre_task_with_node_errors(self, num_prior_errors):
+        """Fails the pre-task of the job execution with a system error after the given number of other jobs have
+        recently failed on the same node with system errors. The node error limit is set to 3 errors in 10 minutes.
+
+        :param num_prior_errors: The number of other jobs that recently failed on the node with system errors
+        :type num_prior_errors: int
+        :returns: The node of the job execution, reloaded from the database
+        :rtype: :class:`node.models.Node`
+        """
+
+        # Clear error cache so test works correctly
+        CACHED_BUILTIN_ERRORS.clear()
+
+        # Use a separate scheduler manager so the settings do not leak into other tests through the global one
+        Scheduler.objects.all().update(node_error_period=10, max_node_errors=3)
+        manager = SchedulerManager()
+        manager.sync_with_database()
+
+        job_exe = JobExecution.objects.get_job_exe_with_job_and_job_type(self._job_exe_id)
+        system_error = error_test_utils.create_error(category='SYSTEM')
+        for _ in range(num_prior_errors):
+            job_test_utils.create_job_exe(status='FAILED', error=system_error, node=job_exe.node,
+                                          ended=now() - timedelta(minutes=1))
+        running_job_exe = RunningJobExecution(job_exe)
+
+        # Start pre-task
+        task = running_job_exe.start_next_task()
+        pre_task_id = task.id
+
+        # Pre-task fails to launch, which is a system error
+        update = job_test_utils.create_task_status_update(pre_task_id, 'agent', TaskStatusUpdate.FAILED, now())
+        with patch('job.execution.running.job_exe._get_scheduler_mgr', return_value=manager):
+            running_job_exe.task_update(update)
+
+        return Node.objects.get(id=job_exe.node_id)
@@ -22,7 +22,7 @@ from job.configuration.interface.error_interface import ErrorInterface
 from job.configuration.interface.job_interface import JobInterface
 from job.execution import container
 from job.execution.container import SCALE_JOB_EXE_INPUT_PATH, SCALE_JOB_EXE_OUTPUT_PATH
-from job.models import Job, JobExecution, JobType, JobTypeRevision
+from job.models import Job, JobExecution, JobType, JobTypeRevision, is_job_exe_timed_out
 from job.resources import JobResources
 from storage.container import get_workspace_volume_path
 from trigger.models import TriggerRule
@@ -1249,3 +1249,46 @@ class TestJobTypeFailedStatus(TestCase):
         self.assertEqual(status[3].count, 1)
         self.assertEqual(status[3].first_error, self.entry_4_time)
         self.assertEqual(status[3].last_error, self.entry_4_time)
+
+
+class TestIsJobExeTimedOut(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+    def test_timed_out(self):
+        """Tests a running job execution that has exceeded its timeout"""
+
+        when = timezone.now()
+        started = when - datetime.timedelta(seconds=61)
+        self.assertTrue(is_job_exe_timed_out('RUNNING', started, 60, when))
+
+    def test_not_timed_out(self):
+        """Tests a running job execution that is still within its timeout"""
+
+        when = timezone.now()
+        started = when - datetime.timedelta(seconds=59)
+        self.assertFalse(is_job_exe_timed_out('RUNNING', started, 60, when))
+
+    def test_not_running(self):
+        """Tests a job execution that has exceeded its timeout but is no longer running"""
+
+        when = timezone.now()
+        started = when - datetime.timedelta(seconds=61)
+        self.assertFalse(is_job_exe_timed_out('COMPLETED', started, 60, when))
+
+    def test_no_timeout(self):
+        """Tests a running job execution without a timeout"""
+
+        when = timezone.now()
+        self.assertFalse(is_job_exe_timed_out('RUNNING', when - datetime.timedelta(days=1), None, when))
+
+    def test_model_is_timed_out(self):
+        """Tests that the job execution model uses the same check"""
+
+        when = timezone.now()
+        job_exe = JobExecution(status='RUNNING', started=when - datetime.timedelta(seconds=61), timeout=60)
+        self.assertTrue(job_exe.is_timed_out(when))
+
+        job_exe.status = 'FAILED'
+        self.assertFalse(job_exe.is_timed_out(when))
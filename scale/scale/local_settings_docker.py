@@ -3,6 +3,7 @@
 # Include all the default settings.
 from settings import *
 import elasticsearch
+from django.utils.functional import SimpleLazyObject
 
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = os.environ.get('SCALE_SECRET_KEY', INSECURE_DEFAULT_KEY)
@@ -27,7 +28,8 @@ STATIC_URL = os.environ.get('SCALE_STATIC_URL', '/service/%s/static/' % FRAMEWOR
 LOGGING_ADDRESS = os.environ.get('SCALE_LOGGING_ADDRESS', LOGGING_ADDRESS)
 ELASTICSEARCH_URLS = os.environ.get('SCALE_ELASTICSEARCH_URLS', ELASTICSEARCH_URLS)
 if ELASTICSEARCH_URLS:
-    ELASTICSEARCH = elasticsearch.Elasticsearch(
+    # Create the client on first use so loading settings does not wait on sniffing the cluster
+    ELASTICSEARCH = SimpleLazyObject(lambda: elasticsearch.Elasticsearch(
         ELASTICSEARCH_URLS.split(','),
         # sniff before doing anything
         sniff_on_start=True,
@@ -35,7 +37,7 @@ if ELASTICSEARCH_URLS:
         sniff_on_connection_fail=True,
         # and also every 60 seconds
         sniffer_timeout=60
-    )
+    ))
 
 DB_HOST = os.environ.get('SCALE_DB_HOST', '')
 if DB_HOST == '':
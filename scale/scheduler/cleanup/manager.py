@@ -27,6 +27,17 @@ class CleanupManager(object):
         with self._lock:
             self._nodes[job_exe.node_id].add_job_execution(job_exe)
 
+    def add_job_executions(self, job_exes):
+        """Adds a list of job executions that need to be cleaned up
+
+        :param job_exes: The job executions to add
+        :type job_exes: [:class:`job.execution.running.job_exe.RunningJobExecution`]
+        """
+
+        with self._lock:
+            for job_exe in job_exes:
+                self._nodes[job_exe.node_id].add_job_execution(job_exe)
+
     def get_next_tasks(self):
         """Returns the next cleanup tasks to schedule
 
@@ -4,7 +4,7 @@ import logging
 import os
 
 from django.conf import settings
-from django.core.management import execute_from_command_line
+from django.core.management import call_command
 from django.core.management.base import BaseCommand
 
 logger = logging.getLogger(__name__)
@@ -23,23 +23,20 @@ class Command(BaseCommand):
         """
         logger.info('Command starting: load_all_data')
         fixture_names = []
-        manage_path = os.path.join(settings.BASE_DIR, 'manage.py')
 
         for app_dir in os.listdir(settings.BASE_DIR):
-            app_dir_path = os.path.join(settings.BASE_DIR, app_dir)
-            if not os.path.isdir(app_dir_path):
+            # A single stat of the fixtures path covers both the app and its fixtures directory existing
+            fixture_dir_path = os.path.join(settings.BASE_DIR, app_dir, 'fixtures')
+            if not os.path.isdir(fixture_dir_path):
                 continue
-            sub_dirs = os.listdir(app_dir_path)
-            if 'fixtures' in sub_dirs:
-                fixture_dir_path = os.path.join(app_dir_path, 'fixtures')
-                for entry in os.listdir(fixture_dir_path):
-                    if os.path.isfile(os.path.join(fixture_dir_path, entry)):
-                        if entry.endswith('.json'):
-                            logger.info('Discovered: %s -> %s', app_dir, entry)
-                            fixture_names.append(entry)
-
-        for name in fixture_names:
-            cmd_list = [manage_path, 'loaddata', name]
-            logger.info('Executing: %s', ' '.join(cmd_list))
-            execute_from_command_line(cmd_list)
+            for entry in os.listdir(fixture_dir_path):
+                # Check the name first so only JSON entries need a stat call
+                if entry.endswith('.json') and os.path.isfile(os.path.join(fixture_dir_path, entry)):
+                    logger.info('Discovered: %s -> %s', app_dir, entry)
+                    fixture_names.append(entry)
+
+        # Load all fixtures with one command so they share a single transaction and constraint check
+        if fixture_names:
+            logger.info('Executing: loaddata %s', ' '.join(fixture_names))
+            call_command('loaddata', *fixture_names)
         logger.info('Command completed: load_all_data')
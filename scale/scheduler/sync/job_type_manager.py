@@ -14,6 +14,7 @@ class JobTypeManager(object):
         """
 
         self._job_types = {}  # {Job Type ID: Job Type}
+        self._last_modified = None  # Latest last_modified value of the job types from the database
         self._lock = threading.Lock()
 
     def get_job_type(self, job_type_id):
@@ -45,11 +46,39 @@ class JobTypeManager(object):
         """
 
         updated_job_types = {}
+        last_modified = None
         for job_type in JobType.objects.all().iterator():
             updated_job_types[job_type.id] = job_type
+            if not last_modified or job_type.last_modified > last_modified:
+                last_modified = job_type.last_modified
 
         with self._lock:
             self._job_types = updated_job_types
+            self._last_modified = last_modified
+
+    def sync_updates_with_database(self):
+        """Syncs with the database to retrieve only the job type models that have been modified since the last sync.
+        This does not detect job types that were removed, so :meth:`sync_with_database` should still be called
+        periodically.
+        """
+
+        with self._lock:
+            last_modified = self._last_modified
+
+        if not last_modified:
+            self.sync_with_database()
+            return
+
+        # Models modified at the exact time of the last sync are queried again in case more were saved at that time
+        updated_job_types = {}
+        for job_type in JobType.objects.filter(last_modified__gte=last_modified).iterator():
+            updated_job_types[job_type.id] = job_type
+            if job_type.last_modified > last_modified:
+                last_modified = job_type.last_modified
+
+        with self._lock:
+            self._job_types.update(updated_job_types)
+            self._last_modified = last_modified
 
 
 job_type_mgr = JobTypeManager()
@@ -39,6 +39,22 @@ class SchedulerManager(object):
 
         return self._mesos_address
 
+    def get_node_error_settings(self):
+        """Returns the settings used to decide when a node should be paused due to a high number of system errors. The
+        scheduler model from the last database sync is used if available.
+
+        :returns: A tuple of the number of minutes sampled and the maximum number of errors allowed in that period
+        :rtype: (int, float)
+        """
+
+        with self._lock:
+            scheduler = self._scheduler
+
+        if not scheduler:
+            # Not synced with the database yet
+            scheduler = Scheduler.objects.only('node_error_period', 'max_node_errors').first()
+        return scheduler.node_error_period, scheduler.max_node_errors
+
     def is_paused(self):
         """Indicates whether the scheduler is currently paused or not
 
@@ -14,6 +14,7 @@ class WorkspaceManager(object):
         """
 
         self._workspaces = {}  # {Workspace Name: Workspace}
+        self._last_modified = None  # Latest last_modified value of the workspaces from the database
         self._lock = threading.Lock()
 
     def get_workspaces(self):
@@ -31,11 +32,39 @@ class WorkspaceManager(object):
         """
 
         updated_workspaces = {}
+        last_modified = None
         for workspace in Workspace.objects.all().iterator():
             updated_workspaces[workspace.name] = workspace
+            if not last_modified or workspace.last_modified > last_modified:
+                last_modified = workspace.last_modified
 
         with self._lock:
             self._workspaces = updated_workspaces
+            self._last_modified = last_modified
+
+    def sync_updates_with_database(self):
+        """Syncs with the database to retrieve only the workspace models that have been modified since the last sync.
+        This does not detect workspaces that were removed, so :meth:`sync_with_database` should still be called
+        periodically.
+        """
+
+        with self._lock:
+            last_modified = self._last_modified
+
+        if not last_modified:
+            self.sync_with_database()
+            return
+
+        # Models modified at the exact time of the last sync are queried again in case more were saved at that time
+        updated_workspaces = {}
+        for workspace in Workspace.objects.filter(last_modified__gte=last_modified).iterator():
+            updated_workspaces[workspace.name] = workspace
+            if workspace.last_modified > last_modified:
+                last_modified = workspace.last_modified
+
+        with self._lock:
+            self._workspaces.update(updated_workspaces)
+            self._last_modified = last_modified
 
 
 workspace_mgr = WorkspaceManager()
@@ -110,3 +110,26 @@ class TestCleanupManager(TestCase):
         self.assertEqual(task.agent_id, self.node_agent_1)
         self.assertFalse(task.is_initial_cleanup)
         self.assertEqual(len(task.job_exes), 1)
+
+    def test_add_job_executions(self):
+        """Tests adding a list of job executions to clean up"""
+
+        manager = CleanupManager()
+        node_1 = Node(self.node_agent_1, self.node_1)
+        node_2 = Node(self.node_agent_2, self.node_2)
+        manager.update_nodes([node_1, node_2])
+        tasks = manager.get_next_tasks()
+
+        # Complete initial cleanup tasks
+        for task in tasks:
+            task.launch(now())
+            update = job_test_utils.create_task_status_update(task.id, task.agent_id, TaskStatusUpdate.FINISHED, now())
+            manager.handle_task_update(update)
+
+        job_exe_2 = job_test_utils.create_job_exe(node=self.node_2)
+        manager.add_job_executions([RunningJobExecution(self.job_exe_1), RunningJobExecution(job_exe_2)])
+        tasks = manager.get_next_tasks()
+        self.assertEqual(len(tasks), 2)
+        for task in tasks:
+            self.assertFalse(task.is_initial_cleanup)
+            self.assertEqual(len(task.job_exes), 1)
@@ -3,6 +3,7 @@ from __future__ import unicode_literals
 import django
 from django.test import TestCase
 
+from job.test import utils as job_test_utils
 from scheduler.sync.job_type_manager import JobTypeManager
 
 
@@ -16,3 +17,14 @@ class TestJobTypeManager(TestCase):
 
         manager = JobTypeManager()
         manager.sync_with_database()
+
+    def test_sync_updates(self):
+        """Tests syncing only the job types that have been modified"""
+
+        manager = JobTypeManager()
+        manager.sync_with_database()
+        count = len(manager.get_job_types())
+
+        job_test_utils.create_job_type()
+        manager.sync_updates_with_database()
+        self.assertEqual(len(manager.get_job_types()), count + 1)
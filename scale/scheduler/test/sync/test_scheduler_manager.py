@@ -17,3 +17,16 @@ class TestSchedulerManager(TestCase):
 
         manager = SchedulerManager()
         manager.sync_with_database()
+
+    def test_get_node_error_settings(self):
+        """Tests getting the node error settings before and after a database sync"""
+
+        Scheduler.objects.initialize_scheduler()
+        Scheduler.objects.all().update(node_error_period=5, max_node_errors=10.0)
+        manager = SchedulerManager()
+
+        self.assertEqual(manager.get_node_error_settings(), (5, 10.0))
+
+        manager.sync_with_database()
+        Scheduler.objects.all().update(node_error_period=1)
+        self.assertEqual(manager.get_node_error_settings(), (5, 10.0))
@@ -3,6 +3,7 @@ from __future__ import unicode_literals
 import django
 from django.test import TestCase
 
+from storage.test import utils as storage_test_utils
 from scheduler.sync.workspace_manager import WorkspaceManager
 
 
@@ -16,3 +17,14 @@ class TestWorkspaceManager(TestCase):
 
         manager = WorkspaceManager()
         manager.sync_with_database()
+
+    def test_sync_updates(self):
+        """Tests syncing only the workspaces that have been modified"""
+
+        manager = WorkspaceManager()
+        manager.sync_with_database()
+        count = len(manager.get_workspaces())
+
+        storage_test_utils.create_workspace()
+        manager.sync_updates_with_database()
+        self.assertEqual(len(manager.get_workspaces()), count + 1)
@@ -2,7 +2,6 @@
 from __future__ import unicode_literals
 
 import logging
-import math
 import time
 
 from django.db import DatabaseError
@@ -10,7 +9,7 @@ from django.utils.timezone import now
 from mesos.interface import mesos_pb2
 
 from job.execution.running.manager import running_job_mgr
-from job.models import JobExecution
+from job.models import JobExecution, is_job_exe_timed_out
 from scheduler.cleanup.manager import cleanup_mgr
 from scheduler.node.manager import node_mgr
 from scheduler.sync.job_type_manager import job_type_mgr
@@ -24,6 +23,8 @@ logger = logging.getLogger(__name__)
 class DatabaseSyncThread(object):
     """This class manages the database sync background thread for the scheduler"""
 
+    FULL_SYNC_PERIOD = 60  # seconds, counted in sync passes of THROTTLE seconds each
+    SHUTDOWN_CHECK_PERIOD = 1  # seconds
     THROTTLE = 10  # seconds
 
     def __init__(self, driver):
@@ -34,6 +35,7 @@ class DatabaseSyncThread(object):
         """
 
         self._driver = driver
+        self._incremental_syncs_left = 0  # Number of incremental syncs to do before the next full sync
         self._running = True
 
     @property
@@ -64,21 +66,22 @@ class DatabaseSyncThread(object):
 
         while self._running:
 
-            started = now()
+            started = time.time()
 
             try:
                 self._perform_sync()
             except Exception:
                 logger.exception('Critical error in database sync thread')
 
-            ended = now()
-            secs_passed = (ended - started).total_seconds()
-
-            # If time takes less than a minute, throttle
-            if secs_passed < DatabaseSyncThread.THROTTLE:
-                # Delay until full throttle time reached
-                delay = math.ceil(DatabaseSyncThread.THROTTLE - secs_passed)
-                time.sleep(delay)
+            # Wait out the rest of the throttle period, sleeping in short intervals so shutdown is noticed quickly. The
+            # elapsed time is measured with the wall clock, so a negative elapsed time (the clock stepped backwards) is
+            # ignored rather than extending the wait past the throttle period.
+            secs_passed = max(0, time.time() - started)
+            delay = DatabaseSyncThread.THROTTLE - secs_passed
+            while self._running and delay > 0:
+                sleep_time = min(delay, DatabaseSyncThread.SHUTDOWN_CHECK_PERIOD)
+                time.sleep(sleep_time)
+                delay -= sleep_time
 
         logger.info('Database sync thread stopped')
 
@@ -94,8 +97,18 @@ class DatabaseSyncThread(object):
         """
 
         scheduler_mgr.sync_with_database()
-        job_type_mgr.sync_with_database()
-        workspace_mgr.sync_with_database()
+
+        # Job types and workspaces rarely change, so most syncs only query the models that have been modified. A full
+        # sync is done every few passes to catch anything else, such as removed models. Passes are counted rather than
+        # timed so that wall clock steps cannot delay the full sync.
+        if self._incremental_syncs_left > 0:
+            self._incremental_syncs_left -= 1
+            job_type_mgr.sync_updates_with_database()
+            workspace_mgr.sync_updates_with_database()
+        else:
+            job_type_mgr.sync_with_database()
+            workspace_mgr.sync_with_database()
+            self._incremental_syncs_left = self.FULL_SYNC_PERIOD // self.THROTTLE - 1
 
         mesos_master = scheduler_mgr.mesos_address
         node_mgr.sync_with_database(mesos_master.hostname, mesos_master.port)
@@ -106,33 +119,48 @@ class DatabaseSyncThread(object):
         """Syncs job executions that are currently running by handling any canceled or timed out executions
         """
 
-        running_job_exes = {}
-        for job_exe in running_job_mgr.get_all_job_exes():
-            running_job_exes[job_exe.id] = job_exe
+        running_job_exes = {job_exe.id: job_exe for job_exe in running_job_mgr.get_all_job_exes()}
+        if not running_job_exes:
+            return
+        job_exe_ids = list(running_job_exes)
 
         right_now = now()
 
-        for job_exe_model in JobExecution.objects.filter(id__in=running_job_exes.keys()).iterator():
-            running_job_exe = running_job_exes[job_exe_model.id]
+        # Only the fields needed to check for canceled and timed out executions are loaded, as plain tuples
+        job_exe_qry = JobExecution.objects.filter(id__in=job_exe_ids)
+        job_exe_qry = job_exe_qry.values_list('id', 'status', 'started', 'timeout')
+        tasks_to_kill = []
+        finished_job_exes = []
+        for job_exe_id, status, started, timeout in job_exe_qry.iterator():
+            running_job_exe = running_job_exes[job_exe_id]
             task_to_kill = None
 
-            if job_exe_model.status == 'CANCELED':
+            if status == 'CANCELED':
                 try:
                     task_to_kill = running_job_exe.execution_canceled()
                 except DatabaseError:
                     logger.exception('Error canceling job execution %i', running_job_exe.id)
-            elif job_exe_model.is_timed_out(right_now):
+            elif is_job_exe_timed_out(status, started, timeout, right_now):
                 try:
                     task_to_kill = running_job_exe.execution_timed_out(right_now)
                 except DatabaseError:
                     logger.exception('Error failing timed out job execution %i', running_job_exe.id)
 
             if task_to_kill:
-                pb_task_to_kill = mesos_pb2.TaskID()
+                tasks_to_kill.append(task_to_kill)
+
+            if running_job_exe.is_finished():
+                finished_job_exes.append(running_job_exe)
+
+        # Kill tasks and hand off finished job executions once the query is done, rather than per row
+        if tasks_to_kill:
+            # The driver serializes the task ID during the call, so one message can be reused for every kill
+            pb_task_to_kill = mesos_pb2.TaskID()
+            for task_to_kill in tasks_to_kill:
                 pb_task_to_kill.value = task_to_kill.id
                 logger.info('Killing task %s', task_to_kill.id)
                 self._driver.killTask(pb_task_to_kill)
 
-            if running_job_exe.is_finished():
-                running_job_mgr.remove_job_exe(running_job_exe.id)
-                cleanup_mgr.add_job_execution(running_job_exe)
+        for running_job_exe in finished_job_exes:
+            running_job_mgr.remove_job_exe(running_job_exe.id)
+        cleanup_mgr.add_job_executions(finished_job_exes)
@@ -6,7 +6,6 @@ import re
 
 import django.utils.dateparse as dateparse
 import django.utils.timezone as timezone
-import django.utils.six as six
 
 
 iso8601_duration_re = re.compile(
@@ -20,6 +19,14 @@ iso8601_duration_re = re.compile(
     r'$'
 )
 
+# Matches the common UTC form of an ISO 8601 datetime (2016-01-01T00:00:00.000Z) so it can be built directly
+iso8601_utc_datetime_re = re.compile(
+    r'^(\d{4})-(\d{1,2})-(\d{1,2})'
+    r'T(\d{1,2}):(\d{1,2}):(\d{1,2})'
+    r'(?:\.(\d{1,6})\d{0,6})?'
+    r'Z$'
+)
+
 
 # TODO The following is from the Django 1.8 django.utils.dateparse, we can remove this when upgrading.
 def parse_duration(value):
@@ -28,9 +35,9 @@ def parse_duration(value):
     """
     match = iso8601_duration_re.match(value)
     if match:
-        kw = match.groupdict()
-        kw = {k: float(v) for k, v in six.iteritems(kw) if v is not None}
-        return datetime.timedelta(**kw)
+        days, hours, minutes, seconds = match.group('days', 'hours', 'minutes', 'seconds')
+        return datetime.timedelta(days=float(days) if days else 0, hours=float(hours) if hours else 0,
+                                  minutes=float(minutes) if minutes else 0, seconds=float(seconds) if seconds else 0)
 
 
 # Hack to fix ISO8601 for datetime filters.
@@ -40,6 +47,13 @@ def parse_duration(value):
 # see https://code.djangoproject.com/tickets/23448
 # Solution modified from http://akinfold.blogspot.com/2012/12/datetimefield-doesnt-accept-iso-8601.html
 def parse_datetime(value):
+    match = iso8601_utc_datetime_re.match(value)
+    if match:
+        year, month, day, hour, minute, second, microsecond = match.groups()
+        microsecond = int(microsecond) * 10 ** (6 - len(microsecond)) if microsecond else 0
+        return datetime.datetime(int(year), int(month), int(day), int(hour), int(minute), int(second), microsecond,
+                                 tzinfo=timezone.utc)
+
     if 'Z' not in value and '+' not in value:
         raise ValueError('Datetime value must include a timezone: %s' % value)
     return dateparse.parse_datetime(value)
@@ -10,14 +10,67 @@ import rest_framework.serializers as serializers
 import rest_framework.status as status
 from django.conf import settings
 from django.conf.urls import include, patterns, url
+from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
 from rest_framework.exceptions import APIException
 from rest_framework.settings import api_settings
 
 import util.parse as parse_util
 
 
+# Maps each accepted boolean parameter string to its value
+_BOOL_MAP = {'true': True, 't': True, '1': True, 'false': False, 'f': False, '0': False}
+
+# Base type of all strings, checked with a single type rather than a tuple of types
+try:
+    _STRING_TYPE = basestring
+except NameError:
+    _STRING_TYPE = str
+
+# Sentinel used to detect missing parameters with a single lookup
+_MISSING = object()
+
+# Cache of relative day time stamps, only valid for the current day
+_RELATIVE_DAYS_CACHE = {}  # {(Days, Today ordinal): datetime}
+_RELATIVE_DAYS_CACHE_SIZE = 32
+
+
+class LazyCountPaginator(Paginator):
+    """Paginator that skips the COUNT query whenever the requested page already reveals the total number of objects."""
+
+    def page(self, number):
+        """Returns a Page object for the given 1-based page number. A page with fewer objects than the page size must be
+        the last page, so the total count is computed from it instead of being queried.
+
+        :param number: The 1-based page number
+        :type number: int
+        :returns: The requested page
+        :rtype: :class:`django.core.paginator.Page`
+
+        :raises :class:`django.core.paginator.InvalidPage`: If the page number is invalid or the page is empty
+        """
+
+        if self.orphans or self._count is not None:
+            return super(LazyCountPaginator, self).page(number)
+
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger('That page number is not an integer')
+        if number < 1:
+            raise EmptyPage('That page number is less than 1')
+
+        bottom = (number - 1) * self.per_page
+        object_list = list(self.object_list[bottom:bottom + self.per_page])
+        if len(object_list) < self.per_page:
+            if not object_list and (number > 1 or not self.allow_empty_first_page):
+                raise EmptyPage('That page contains no results')
+            self._count = bottom + len(object_list)
+        return self._get_page(object_list, number, self)
+
+
 class DefaultPagination(pagination.PageNumberPagination):
     """Default configuration class for the paging system."""
+    django_paginator_class = LazyCountPaginator
     page_size = 100
     page_size_query_param = 'page_size'
     max_page_size = 1000
@@ -53,16 +106,17 @@ def check_update(request, fields):
     :param request: The context of an active HTTP request.
     :type request: :class:`rest_framework.request.Request`
     :param fields: A list of field names that are permitted.
-    :type fields: [string]
+    :type fields: [string] or (string)
     :returns: True when the request does not include extra fields.
     :rtype: bool
 
     :raises :class:`util.rest.ReadOnly`: If the request includes unsupported fields to update.
-    :raises :class:`exceptions.AssertionError`: If fields in not a list or None.
+    :raises :class:`exceptions.AssertionError`: If fields in not a list, tuple or None.
     """
     fields = fields or []
-    assert(isinstance(fields, list))
-    extra = filter(lambda x, y=fields: x not in y, request.data.keys())
+    assert(isinstance(fields, (list, tuple)))
+    fields_set = frozenset(fields)
+    extra = [key for key in request.data if key not in fields_set]
     if extra:
         raise ReadOnly('Fields do not allow updates: %s' % ', '.join(extra))
     return True
@@ -134,8 +188,10 @@ def has_params(request, *names):
     """
     if not names:
         return False
+    query_params = request.query_params
+    data = request.data
     for name in names:
-        if name not in request.query_params and name not in request.data:
+        if name not in query_params and name not in data:
             return False
     return True
 
@@ -152,8 +208,18 @@ def get_relative_days(days):
     :returns: An absolute time stamp that is the complete range of relative days back.
     :rtype: datetime.datetime
     """
-    base_date = (timezone.now() - datetime.timedelta(days=days)).date()
-    return datetime.datetime.combine(base_date, datetime.time.min).replace(tzinfo=timezone.utc)
+    today = timezone.now().date()
+    key = (days, today.toordinal())
+    result = _RELATIVE_DAYS_CACHE.get(key)
+    if result is None:
+        base_date = today - datetime.timedelta(days=days)
+        result = datetime.datetime.combine(base_date, datetime.time.min).replace(tzinfo=timezone.utc)
+
+        # Entries from previous days are never hit again, so just start over once the cache fills up
+        if len(_RELATIVE_DAYS_CACHE) >= _RELATIVE_DAYS_CACHE_SIZE:
+            _RELATIVE_DAYS_CACHE.clear()
+        _RELATIVE_DAYS_CACHE[key] = result
+    return result
 
 
 def get_url(path):
@@ -219,6 +285,33 @@ def parse_string(request, name, default_value=None, required=True, accepted_valu
     return value
 
 
+def make_string_parser(name, default_value=None, required=True, accepted_values=None):
+    """Creates a function that parses a string parameter from a given request, the same as :meth:`parse_string`. This is
+    useful for parameters with a fixed list of accepted values, since the values are only converted to a set once.
+
+    :param name: The name of the parameter to parse.
+    :type name: string
+    :param default_value: The name of the parameter to parse.
+    :type default_value: string
+    :param required: Indicates whether or not the parameter is required. An exception will be raised if the parameter
+        does not exist, there is no default value, and required is True.
+    :type required: bool
+    :param accepted_values: A list of values that are acceptable for the parameter.
+    :type accepted_values: [string]
+    :returns: A function that takes the request and returns the value of the named parameter or the default value.
+    :rtype: function
+    """
+    accepted_set = frozenset(accepted_values) if accepted_values else None
+    error_msg = 'Parameter "%s" values must be one of: %s' % (name, accepted_values)
+
+    def parse(request):
+        value = _get_param(request, name, default_value, required)
+        if value and accepted_set and not _is_accepted_value(value, accepted_set):
+            raise BadParameter(error_msg)
+        return value
+    return parse
+
+
 def parse_string_list(request, name, default_value=None, required=True, accepted_values=None):
     """Parses a list of string parameters from the given request.
 
@@ -261,15 +354,13 @@ def parse_bool(request, name, default_value=None, required=True):
     :raises :class:`util.rest.BadParameter`: If the value cannot be parsed.
     """
     value = _get_param(request, name, default_value, required)
-    if not isinstance(value, basestring):
+    if not isinstance(value, _STRING_TYPE):
         return value
 
-    value = value.strip().lower()
-    if value == 'true' or value == 't' or value == '1':
-        return True
-    if value == 'false' or value == 'f' or value == '0':
-        return False
-    raise BadParameter('Parameter must be a valid boolean: "%s"' % name)
+    try:
+        return _BOOL_MAP[value.strip().lower()]
+    except KeyError:
+        raise BadParameter('Parameter must be a valid boolean: "%s"' % name)
 
 
 def parse_int(request, name, default_value=None, required=True, accepted_values=None):
@@ -292,7 +383,7 @@ def parse_int(request, name, default_value=None, required=True, accepted_values=
     :raises :class:`util.rest.BadParameter`: If the value cannot be parsed.
     """
     value = _get_param(request, name, default_value, required)
-    if not isinstance(value, basestring):
+    if not isinstance(value, _STRING_TYPE):
         return value
 
     try:
@@ -325,12 +416,10 @@ def parse_int_list(request, name, default_value=None, required=True, accepted_va
     param_list = _get_param_list(request, name, default_value, required)
 
     if param_list and len(param_list):
-        values = []
-        for param in param_list:
-            try:
-                values.append(int(param))
-            except (TypeError, ValueError):
-                raise BadParameter('Parameter must be a valid integer: "%s"' % name)
+        try:
+            values = list(map(int, param_list))
+        except (TypeError, ValueError):
+            raise BadParameter('Parameter must be a valid integer: "%s"' % name)
         _check_accepted_values(name, values, accepted_values)
         return values
     return param_list
@@ -356,7 +445,7 @@ def parse_float(request, name, default_value=None, required=True, accepted_value
     :raises :class:`util.rest.BadParameter`: If the value cannot be parsed.
     """
     value = _get_param(request, name, default_value, required)
-    if not isinstance(value, basestring):
+    if not isinstance(value, _STRING_TYPE):
         return value
 
     try:
@@ -385,7 +474,7 @@ def parse_timestamp(request, name, default_value=None, required=True):
     :raises :class:`util.rest.BadParameter`: If the value cannot be parsed.
     """
     value = _get_param(request, name, default_value, required)
-    if not isinstance(value, basestring):
+    if not isinstance(value, _STRING_TYPE):
         return value
 
     try:
@@ -415,7 +504,7 @@ def parse_duration(request, name, default_value=None, required=True):
     :raises :class:`util.rest.BadParameter`: If the value cannot be parsed.
     """
     value = _get_param(request, name, default_value, required)
-    if not isinstance(value, basestring):
+    if not isinstance(value, _STRING_TYPE):
         return value
 
     try:
@@ -445,7 +534,7 @@ def parse_datetime(request, name, default_value=None, required=True):
     :raises :class:`util.rest.BadParameter`: If the value cannot be parsed.
     """
     value = _get_param(request, name, default_value, required)
-    if not isinstance(value, basestring):
+    if not isinstance(value, _STRING_TYPE):
         return value
 
     try:
@@ -495,11 +584,15 @@ def _get_param(request, name, default_value=None, required=True):
     :returns: The value of the named parameter or the default value if provided.
     :rtype: object
     """
-    value = None
-    if name in request.query_params:
-        value = request.query_params.get(name)
-    if value is None and name in request.data:
-        value = request.data.get(name)
+    value = request.query_params.get(name, _MISSING)
+    if value is _MISSING:
+        value = None
+
+    # The request body is not always a dictionary, so check for the key before accessing it
+    if value is None:
+        data = request.data
+        if name in data:
+            value = data.get(name)
 
     if value is None and default_value is not None:
         return default_value
@@ -516,16 +609,23 @@ def _get_param_list(request, name, default_value=None, required=True):
     :type request: :class:`rest_framework.request.Request`
     :param name: The name of the parameter to parse.
     :type name: string
-    :param default_value: The name of the parameter to parse.
-    :type default_value: object
+    :param default_value: The default list of values, which is returned as is.
+    :type default_value: [object]
+    :param required: Indicates whether or not the parameter is required. An exception will be raised if the parameter
+        does not exist, there is no default value, and required is True.
+    :type required: bool
     :returns: A list of the values of the named parameter or the default value if provided.
     :rtype: [object]
     """
+    # Only build the list of query values when the parameter is actually present
     value = None
-    if name in request.query_params:
-        value = request.query_params.getlist(name)
-    if value is None and name in request.data:
-        value = request.data.get(name)
+    query_params = request.query_params
+    if name in query_params:
+        value = query_params.getlist(name) or None
+    if value is None:
+        data = request.data
+        if name in data:
+            value = data.get(name)
 
     if value is None and default_value is not None:
         return default_value
@@ -550,6 +650,23 @@ def _check_accepted_value(name, value, accepted_values):
             raise BadParameter('Parameter "%s" values must be one of: %s' % (name, accepted_values))
 
 
+def _is_accepted_value(value, accepted_set):
+    """Indicates whether a parameter value is in a set of accepted values.
+
+    :param value: A value to validate.
+    :type value: object
+    :param accepted_set: The set of values that are acceptable for the parameter.
+    :type accepted_set: frozenset
+    :returns: True if the value is accepted, False otherwise.
+    :rtype: bool
+    """
+    # Values from a JSON body may be lists or objects, which cannot be in the set since they are unhashable
+    try:
+        return value in accepted_set
+    except TypeError:
+        return False
+
+
 def _check_accepted_values(name, values, accepted_values):
     """Checks that a list of parameters has values that are acceptable.
 
@@ -561,5 +678,7 @@ def _check_accepted_values(name, values, accepted_values):
     :type accepted_values: [object]
     """
     if values and accepted_values:
+        accepted_set = accepted_values if isinstance(accepted_values, (set, frozenset)) else frozenset(accepted_values)
         for value in values:
-            _check_accepted_value(name, value, accepted_values)
+            if value and not _is_accepted_value(value, accepted_set):
+                raise BadParameter('Parameter "%s" values must be one of: %s' % (name, accepted_values))
@@ -19,6 +19,10 @@ class TestParse(TestCase):
         """Tests parsing a valid ISO duration."""
         self.assertEqual(parse_util.parse_duration('PT3H0M0S'), datetime.timedelta(0, 10800))
 
+    def test_parse_duration_all_parts(self):
+        """Tests parsing a valid ISO duration with every part and a fraction."""
+        self.assertEqual(parse_util.parse_duration('P1DT2H3M4.5S'), datetime.timedelta(1, 7384, 500000))
+
     def test_parse_duration_invalid(self):
         """Tests parsing an invalid ISO duration."""
         self.assertIsNone(parse_util.parse_duration('BAD'))
@@ -28,6 +32,16 @@ class TestParse(TestCase):
         self.assertEqual(parse_util.parse_datetime('2015-01-01T00:00:00Z'),
                          datetime.datetime(2015, 1, 1, tzinfo=timezone.utc))
 
+    def test_parse_datetime_fraction(self):
+        """Tests parsing a valid ISO datetime with fractional seconds."""
+        self.assertEqual(parse_util.parse_datetime('2015-01-01T00:00:00.25Z'),
+                         datetime.datetime(2015, 1, 1, 0, 0, 0, 250000, tzinfo=timezone.utc))
+
+    def test_parse_datetime_offset(self):
+        """Tests parsing a valid ISO datetime with a timezone offset."""
+        self.assertEqual(parse_util.parse_datetime('2015-01-01T02:00:00+02:00'),
+                         datetime.datetime(2015, 1, 1, tzinfo=timezone.utc))
+
     def test_parse_datetime_invalid(self):
         """Tests parsing an invalid ISO datetime."""
         self.assertIsNone(parse_util.parse_datetime('20150101T00:00:00Z'))
@@ -5,6 +5,7 @@ import datetime
 import django
 import django.utils.timezone as timezone
 import mock
+from django.core.paginator import EmptyPage
 from django.http import QueryDict
 from django.test import TestCase
 from mock import MagicMock
@@ -19,6 +20,39 @@ class TestRest(TestCase):
     def setUp(self):
         django.setup()
 
+    def test_lazy_count_paginator_partial_page(self):
+        """Tests paging to a partial last page without counting the objects."""
+        objects = MagicMock()
+        objects.__getitem__.side_effect = lambda key: range(25)[key]
+        paginator = rest_util.LazyCountPaginator(objects, 10)
+
+        page = paginator.page(3)
+        self.assertListEqual(list(page), [20, 21, 22, 23, 24])
+        self.assertEqual(paginator.count, 25)
+        self.assertFalse(page.has_next())
+        self.assertFalse(objects.count.called)
+
+    def test_lazy_count_paginator_full_page(self):
+        """Tests paging to a full page, which needs to count the objects."""
+        objects = MagicMock()
+        objects.__getitem__.side_effect = lambda key: range(25)[key]
+        objects.count.return_value = 25
+        paginator = rest_util.LazyCountPaginator(objects, 10)
+
+        page = paginator.page(1)
+        self.assertListEqual(list(page), range(10))
+        self.assertTrue(page.has_next())
+        self.assertTrue(objects.count.called)
+
+    def test_lazy_count_paginator_empty_page(self):
+        """Tests paging past the last page."""
+        objects = MagicMock()
+        objects.__getitem__.side_effect = lambda key: range(25)[key]
+        paginator = rest_util.LazyCountPaginator(objects, 10)
+
+        self.assertRaises(EmptyPage, paginator.page, 4)
+        self.assertEqual(len(paginator.page(1)), 10)
+
     def test_check_update(self):
         """Tests checking a white-list of parameters allowed to be updated during a POST."""
         request = MagicMock(Request)
@@ -92,6 +126,18 @@ class TestRest(TestCase):
         """Tests checking multiple parameters together."""
         self.assertTrue(rest_util.check_together(['test1', 'test2'], ['value1', 'value2']))
 
+    @mock.patch('django.utils.timezone.now')
+    def test_get_relative_days(self, mock_now):
+        """Tests calculating a relative day time stamp as the day changes."""
+        mock_now.return_value = datetime.datetime(2015, 1, 8, 10, tzinfo=timezone.utc)
+        self.assertEqual(rest_util.get_relative_days(7), datetime.datetime(2015, 1, 1, tzinfo=timezone.utc))
+
+        mock_now.return_value = datetime.datetime(2015, 1, 8, 23, 59, tzinfo=timezone.utc)
+        self.assertEqual(rest_util.get_relative_days(7), datetime.datetime(2015, 1, 1, tzinfo=timezone.utc))
+
+        mock_now.return_value = datetime.datetime(2015, 1, 9, 0, 1, tzinfo=timezone.utc)
+        self.assertEqual(rest_util.get_relative_days(7), datetime.datetime(2015, 1, 2, tzinfo=timezone.utc))
+
     def test_has_params_empty(self):
         """Tests checking parameter presence when none are given."""
         request = MagicMock(Request)
@@ -191,12 +237,44 @@ class TestRest(TestCase):
     def test_parse_string_post(self):
         """Tests parsing a required string parameter that is provided via POST."""
         request = MagicMock(Request)
+        request.query_params = QueryDict('', mutable=True)
         request.data = QueryDict('', mutable=True)
         request.data.update({
             'test': 'value1',
         })
         self.assertEqual(rest_util.parse_string(request, 'test'), 'value1')
 
+    def test_make_string_parser(self):
+        """Tests parsing a string parameter with a parser created ahead of time."""
+        parse_test = rest_util.make_string_parser('test', accepted_values=['value1', 'value2'])
+        request = MagicMock(Request)
+        request.query_params = QueryDict('', mutable=True)
+        request.query_params.update({
+            'test': 'value1',
+        })
+        self.assertEqual(parse_test(request), 'value1')
+
+        request.query_params['test'] = 'value3'
+        self.assertRaises(BadParameter, parse_test, request)
+
+    def test_make_string_parser_unhashable(self):
+        """Tests parsing a JSON body value that is not a string with a parser created ahead of time."""
+        parse_test = rest_util.make_string_parser('test', accepted_values=['value1'])
+        request = MagicMock(Request)
+        request.query_params = QueryDict('', mutable=True)
+        request.data = {'test': ['value1']}
+        self.assertRaises(BadParameter, parse_test, request)
+
+        request.data = {'test': {'value1': 'value2'}}
+        self.assertRaises(BadParameter, parse_test, request)
+
+    def test_make_string_parser_optional(self):
+        """Tests parsing an optional string parameter with a parser created ahead of time."""
+        parse_test = rest_util.make_string_parser('test', required=False, accepted_values=['value1'])
+        request = MagicMock(Request)
+        request.query_params = QueryDict('', mutable=True)
+        self.assertIsNone(parse_test(request))
+
     def test_parse_string_list(self):
         """Tests parsing a required list of string parameters that is provided via GET."""
         request = MagicMock(Request)
@@ -245,6 +323,16 @@ class TestRest(TestCase):
 
         self.assertRaises(BadParameter, rest_util.parse_string_list, request, 'test', accepted_values=['value1'])
 
+    def test_parse_string_list_accepted_unhashable(self):
+        """Tests parsing a list of JSON body values that are not strings and do not match the accepted list."""
+        request = MagicMock(Request)
+        request.query_params = QueryDict('', mutable=True)
+        request.data = {'test': ['value1', {'value2': 'value3'}]}
+        self.assertRaises(BadParameter, rest_util.parse_string_list, request, 'test', accepted_values=['value1'])
+
+        request.data = {'test': [['value1']]}
+        self.assertRaises(BadParameter, rest_util.parse_string_list, request, 'test', accepted_values=['value1'])
+
     def test_parse_string_list_accepted_all(self):
         """Tests parsing a list of string parameters where all values are acceptable."""
         request = MagicMock(Request)
@@ -413,6 +501,7 @@ class TestRest(TestCase):
     def test_parse_int_post(self):
         """Tests parsing a required int parameter that is provided via POST."""
         request = MagicMock(Request)
+        request.query_params = QueryDict('', mutable=True)
         request.data = QueryDict('', mutable=True)
         request.data.update({
             'test': '10',
@@ -559,6 +648,7 @@ class TestRest(TestCase):
     def test_parse_float_post(self):
         """Tests parsing a required float parameter that is provided via POST."""
         request = MagicMock(Request)
+        request.query_params = QueryDict('', mutable=True)
         request.data = QueryDict('', mutable=True)
         request.data.update({
             'test': '10.1',